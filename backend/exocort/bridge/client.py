@@ -1,10 +1,35 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import threading
 import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+POOL_HOSTS = 4
+
+_sessions: dict[tuple[str, str, int], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _endpoint_session(provider: str, api_base: str, pool_size: int) -> requests.Session:
+    key = (provider, api_base, pool_size)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _build_session(pool_size)
+            _sessions[key] = session
+        return session
 
 
 @dataclass(slots=True, frozen=True)
@@ -16,9 +41,18 @@ class HttpResponse:
 
 
 class HttpClient:
-    def __init__(self, timeout_s: float, retries: int) -> None:
+    def __init__(
+        self,
+        timeout_s: float,
+        retries: int,
+        *,
+        provider: str = "",
+        api_base: str = "",
+        pool_size: int = 1,
+    ) -> None:
         self._timeout_s = timeout_s
         self._retries = max(0, retries)
+        self._session = _endpoint_session(provider, api_base, max(1, pool_size))
 
     def post_json(
         self,
@@ -75,7 +109,7 @@ class HttpClient:
         last_error: Exception | None = None
         for attempt in range(self._retries + 1):
             try:
-                response = requests.request(
+                response = self._session.request(
                     method,
                     url,
                     timeout=self._timeout_s,
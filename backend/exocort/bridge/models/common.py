@@ -24,5 +24,6 @@ class ProviderConfig:
     api_key_env: str
     timeout_s: float = 30.0
     retries: int = 2
+    max_concurrent_requests: int = 1
     format: str | None = None
     extra_headers: dict[str, str] = field(default_factory=dict)
@@ -22,6 +22,18 @@ from .common import (
 
 DEFAULT_ASR_PROMPT = "Transcribe the audio and return only the transcript."
 DEFAULT_OCR_PROMPT = "Extract the readable text from this image and return only the extracted text."
+GEMINI_SCHEMA_KEYS = frozenset(
+    {
+        "type",
+        "format",
+        "description",
+        "nullable",
+        "enum",
+        "items",
+        "properties",
+        "required",
+    }
+)
 
 
 def asr(
@@ -261,19 +273,9 @@ def _gemini_tool(tool: dict[str, Any]) -> dict[str, Any]:
 def _gemini_schema(schema: object) -> dict[str, Any]:
     if not isinstance(schema, dict):
         return {"type": "object"}
-    allowed_keys = {
-        "type",
-        "format",
-        "description",
-        "nullable",
-        "enum",
-        "items",
-        "properties",
-        "required",
-    }
     normalized: dict[str, Any] = {}
     for key, value in schema.items():
-        if key not in allowed_keys:
+        if key not in GEMINI_SCHEMA_KEYS:
             continue
         if key == "properties" and isinstance(value, dict):
             normalized[key] = {
@@ -14,7 +14,14 @@ from .utils.provider import infer_provider
 class ProviderBridge:
     def __init__(self, config: ProviderConfig) -> None:
         self._config = config
-        self._client = HttpClient(timeout_s=config.timeout_s, retries=config.retries)
+        self._client = HttpClient(
+            timeout_s=config.timeout_s,
+            retries=config.retries,
+            provider=config.provider,
+            api_base=config.api_base,
+            pool_size=config.max_concurrent_requests,
+        )
+        self._resolved_api_key: str | None = None
 
     def asr(self, req: AsrRequest) -> AsrResult:
         provider = self._provider_for(req.model)
@@ -64,6 +71,8 @@ class ProviderBridge:
         raise ValueError(f"response mode is not supported for provider={provider}.")
 
     def _api_key(self) -> str:
+        if self._resolved_api_key is not None:
+            return self._resolved_api_key
         env_name = self._config.api_key_env
         api_key = os.getenv(env_name, "test_key") if env_name else "test_key"
         print(
@@ -72,6 +81,7 @@ class ProviderBridge:
             f"api_key_env={env_name!r} present={bool(env_name and env_name in os.environ)} "
             f"api_key_len={len(api_key)}"
         )
+        self._resolved_api_key = api_key
         return api_key
 
     def _provider_for(self, model: str) -> str:
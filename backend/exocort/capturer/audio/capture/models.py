@@ -19,15 +19,14 @@ class _SegmentCollector:
     recording: bool = False
     speech_chunks: int = 0
     silence_chunks: int = 0
+    speech_ratio: float = 0.0
 
     def __post_init__(self) -> None:
         self.pre_roll = deque(maxlen=self.pre_roll_chunks)
 
     def push(self, chunk: np.ndarray, speech_detected: bool) -> np.ndarray | None:
-        chunk_copy = chunk.copy()
-
         if self.recording:
-            self.chunks.append(chunk_copy)
+            self.chunks.append(chunk)
             self.frames += int(chunk.shape[0])
             if speech_detected:
                 self.speech_chunks += 1
@@ -39,7 +38,7 @@ class _SegmentCollector:
             return None
 
         if speech_detected:
-            self.pending_speech.append(chunk_copy)
+            self.pending_speech.append(chunk)
             self.speech_chunks += 1
             if self.speech_chunks >= self.min_speech_chunks:
                 self.recording = True
@@ -51,13 +50,14 @@ class _SegmentCollector:
                     return self._finish()
             return None
 
-        self.pre_roll.append(chunk_copy)
+        self.pre_roll.append(chunk)
         self.pending_speech.clear()
         self.speech_chunks = 0
         return None
 
     def _finish(self) -> np.ndarray:
         segment = np.concatenate(self.chunks, axis=0)
+        self.speech_ratio = self.speech_chunks / len(self.chunks)
         self.pre_roll.clear()
         self.pending_speech.clear()
         self.chunks.clear()
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-import io
+import os
+from pathlib import Path
+import struct
 import sys
 import time
-import wave
 
 import numpy as np
 import sounddevice as sd
@@ -16,6 +17,9 @@ from ..vad import WebRTCVAD
 from .models import _SegmentCollector
 
 log = get_logger("audio")
+VAD_FRAMES_PER_READ = 4
+WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+WAV_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 
 def _audio_access_error(err: Exception) -> RuntimeError:
@@ -50,28 +54,51 @@ def _probe_audio_input(config: AudioSettings) -> None:
         raise _audio_access_error(err) from err
 
 
-def capture_audio_chunk(config: AudioSettings) -> tuple[np.ndarray, bytes]:
+def capture_audio_chunk(config: AudioSettings) -> np.ndarray:
     frames = int(config.chunk_seconds * config.sample_rate)
     try:
         recording = sd.rec(frames, samplerate=config.sample_rate, channels=config.channels, dtype="int16")
         sd.wait()
     except Exception as err:
         raise _audio_access_error(err) from err
-    return recording, _encode_wav(config, recording)
-
-
-def _encode_wav(config: AudioSettings, recording: np.ndarray) -> bytes:
-    buffer = io.BytesIO()
-    with wave.open(buffer, "wb") as wav_file:
-        wav_file.setnchannels(config.channels)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(config.sample_rate)
-        wav_file.writeframes(recording.astype(np.int16, copy=False).tobytes())
-    return buffer.getvalue()
-
-
-def _capture_vad_segment(config: AudioSettings, vad: WebRTCVAD) -> tuple[np.ndarray, float, int]:
+    return recording
+
+
+def _write_wav(config: AudioSettings, recording: np.ndarray, file_path: Path) -> int:
+    pcm = memoryview(np.ascontiguousarray(recording, dtype=np.int16)).cast("B")
+    block_align = config.channels * 2
+    header = WAV_HEADER.pack(
+        b"RIFF",
+        36 + len(pcm),
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        config.channels,
+        config.sample_rate,
+        config.sample_rate * block_align,
+        block_align,
+        16,
+        b"data",
+        len(pcm),
+    )
+    fd = os.open(file_path, WAV_OPEN_FLAGS, 0o644)
+    try:
+        written = os.writev(fd, (header, pcm)) if hasattr(os, "writev") else 0
+        for part in (header, pcm):
+            skipped = min(written, len(part))
+            written -= skipped
+            view = memoryview(part)[skipped:]
+            while view:
+                view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    return len(header) + len(pcm)
+
+
+def _capture_vad_segment(config: AudioSettings, vad: WebRTCVAD) -> tuple[np.ndarray, float, float, int]:
     window_frames = max(1, vad.frame_samples)
+    read_frames = window_frames * VAD_FRAMES_PER_READ
     max_segment_frames = max(window_frames, int(config.chunk_seconds * config.sample_rate))
     collector = _SegmentCollector(
         max_frames=max_segment_frames,
@@ -95,13 +122,18 @@ def _capture_vad_segment(config: AudioSettings, vad: WebRTCVAD) -> tuple[np.ndar
             samplerate=config.sample_rate,
             channels=config.channels,
             dtype="int16",
-            blocksize=window_frames,
+            blocksize=read_frames,
         ) as stream:
             while True:
-                chunk, overflowed = stream.read(window_frames)
+                block, overflowed = stream.read(read_frames)
                 if overflowed:
                     overflows += 1
-                segment = collector.push(chunk, vad.is_speech(chunk))
+                segment = None
+                for index, speech_detected in enumerate(vad.classify(block)):
+                    offset = index * window_frames
+                    segment = collector.push(block[offset : offset + window_frames], speech_detected)
+                    if segment is not None:
+                        break
                 if segment is None:
                     if time.monotonic() >= next_wait_log_at:
                         log.debug(
@@ -118,7 +150,7 @@ def _capture_vad_segment(config: AudioSettings, vad: WebRTCVAD) -> tuple[np.ndar
                     time.monotonic() - started_at,
                     overflows,
                 )
-                return segment, time.monotonic() - started_at, overflows
+                return segment, collector.speech_ratio, time.monotonic() - started_at, overflows
     except Exception as err:
         raise _audio_access_error(err) from err
 
@@ -140,22 +172,24 @@ def audio_loop(config: AudioSettings) -> None:
         if vad is None:
             started_at = time.monotonic()
             log.debug("starting fixed-size audio capture for %ss", config.chunk_seconds)
-            recording, audio_bytes = capture_audio_chunk(config)
+            recording = capture_audio_chunk(config)
             elapsed = time.monotonic() - started_at
             overflows = 0
+            vad_ratio = None
         else:
             log.debug("waiting for VAD speech segment")
-            recording, elapsed, overflows = _capture_vad_segment(config, vad)
-            audio_bytes = _encode_wav(config, recording)
+            recording, vad_ratio, elapsed, overflows = _capture_vad_segment(config, vad)
         timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
         file_path = output_dir / f"{timestamp}.wav"
-        file_path.write_bytes(audio_bytes)
-        vad_suffix = f" (VAD ratio {vad.last_ratio:.2%})" if vad is not None else ""
+        temp_path = output_dir / f".{timestamp}.wav.tmp"
+        file_size = _write_wav(config, recording, temp_path)
+        temp_path.replace(file_path)
+        vad_suffix = f" (VAD ratio {vad_ratio:.2%})" if vad_ratio is not None else ""
         if overflows:
             log.warning("audio input overflowed %s time(s) while capturing %s", overflows, file_path)
         log.info(
             "captured %s bytes (%.1fs) -> %s%s",
-            len(audio_bytes),
+            file_size,
             elapsed,
             file_path,
             vad_suffix,
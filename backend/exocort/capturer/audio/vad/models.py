@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
-import numpy as np
-import webrtcvad
 
 @dataclass(slots=True)
 class AudioVADConfig:
@@ -13,43 +16,40 @@ class AudioVADConfig:
     pre_roll_seconds: float = 0.3
     min_speech_seconds: float = 0.2
     min_silence_seconds: float = 0.8
+    silence_floor: int = 0
 
 
 class WebRTCVAD:
+    __slots__ = ("config", "sample_rate", "frame_ms", "frame_samples", "detector")
+
     def __init__(self, config: AudioVADConfig, sample_rate: int) -> None:
-        if webrtcvad is None:
+        try:
+            import webrtcvad
+        except ImportError as exc:
             raise RuntimeError(
                 "Audio VAD requires the 'webrtcvad' package. Install dependencies again to enable it."
-            )
+            ) from exc
         self.config = config
         self.sample_rate = sample_rate
         self.frame_ms = self._resolve_frame_ms(config.frame_ms)
         self.frame_samples = sample_rate * self.frame_ms // 1000
         self.detector = webrtcvad.Vad(self._resolve_aggressiveness(config.aggressiveness))
-        self.last_ratio: float = 0.0
-
-    def is_speech(self, samples: np.ndarray) -> bool:
-        pcm = self._prepare_frame(samples)
-        if pcm is None:
-            self.last_ratio = 0.0
-            return False
-
-        speech = bool(self.detector.is_speech(pcm.tobytes(), self.sample_rate))
-        self.last_ratio = 1.0 if speech else 0.0
-        return speech
-
-    def _prepare_frame(self, samples: np.ndarray) -> np.ndarray | None:
-        mono = self._mix_down(samples)
-        if mono.size != self.frame_samples:
-            return None
-        if mono.dtype != np.int16:
-            mono = mono.astype(np.int16)
-        return mono
+
+    def classify(self, block: np.ndarray) -> Iterator[bool]:
+        mono = self._mix_down(block)
+        if mono.dtype != "int16":
+            mono = mono.astype("int16")
+        usable = mono.size - mono.size % self.frame_samples
+        windows = mono[:usable].reshape(-1, self.frame_samples)
+        floor = max(0, int(self.config.silence_floor))
+        audible = (windows.max(axis=1) >= floor) | (windows.min(axis=1) <= -floor)
+        for window, loud in zip(windows, audible):
+            yield bool(loud) and bool(self.detector.is_speech(window.tobytes(), self.sample_rate))
 
     def _mix_down(self, samples: np.ndarray) -> np.ndarray:
         if samples.ndim <= 1:
             return samples.reshape(-1)
-        return samples.mean(axis=1).astype(np.int16)
+        return samples.mean(axis=1).astype("int16")
 
     def _resolve_aggressiveness(self, value: int) -> int:
         return min(3, max(0, int(value)))
@@ -52,4 +52,5 @@ class EndpointSettings:
     format: str = ""
     timeout_s: float = 30.0
     retries: int = 2
+    max_concurrent_requests: int = 1
     expired_in: int | bool = 0
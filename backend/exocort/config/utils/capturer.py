@@ -17,6 +17,7 @@ def parse_vad_settings(data: object) -> AudioVADConfig:
         pre_roll_seconds=float(mapping.get("pre_roll_seconds", 0.3)),
         min_speech_seconds=float(mapping.get("min_speech_seconds", 0.2)),
         min_silence_seconds=float(mapping.get("min_silence_seconds", 0.8)),
+        silence_floor=int(mapping.get("silence_floor", 0)),
     )
 
 
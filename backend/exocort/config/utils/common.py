@@ -90,6 +90,7 @@ def parse_endpoint_common(mapping: dict[str, Any], label: str) -> dict[str, Any]
         "api_key_env": str(mapping.get("api_key_env", "test_key")),
         "timeout_s": float(mapping.get("timeout_s", 30.0)),
         "retries": int(mapping.get("retries", 2)),
+        "max_concurrent_requests": max(1, int(mapping.get("max_concurrent_requests", 1))),
         "expired_in": parse_expired_in(mapping.get("expired_in", 0), f"{label}.expired_in"),
     }
 
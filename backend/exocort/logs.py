@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import logging
 
+_configured_level: int | None = None
+
 
 def configure_logging(level: str = "INFO") -> None:
+    global _configured_level
     resolved_level = _resolve_level(level)
+    if resolved_level == _configured_level and logging.getLogger().handlers:
+        return
     logging.basicConfig(
         level=resolved_level,
         format="[%(levelname)s] [%(processName)s:%(threadName)s] [%(name)s] %(message)s",
         force=True,
     )
+    _configured_level = resolved_level
 
 
 def get_logger(*parts: str) -> logging.Logger:
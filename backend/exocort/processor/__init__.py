@@ -1,14 +1,3 @@
-from .asr import AsrResponse, asr_text, parse_asr_response
-from .ocr import OcrPage, OcrResponse, ocr_text, parse_ocr_response
 from .service import processing_loop
 
-__all__ = [
-    "AsrResponse",
-    "OcrPage",
-    "OcrResponse",
-    "asr_text",
-    "ocr_text",
-    "parse_asr_response",
-    "parse_ocr_response",
-    "processing_loop",
-]
+__all__ = ["processing_loop"]
@@ -1,4 +0,0 @@
-from .models import AsrResponse
-from .service import asr_text, parse_asr_response
-
-__all__ = ["AsrResponse", "asr_text", "parse_asr_response"]
@@ -1,8 +0,0 @@
-from __future__ import annotations
-
-from dataclasses import dataclass
-
-
-@dataclass(slots=True, frozen=True)
-class AsrResponse:
-    text: str
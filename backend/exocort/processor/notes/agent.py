@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import os
-import uuid
+import secrets
+from functools import lru_cache
 from typing import Any
 
 from exocort.config import NotesSettings
 from exocort.bridge import ProviderBridge, ProviderConfig, ResponseRequest
 
 from .models import BatchCandidate, BatchRunResult, ToolCallResult
-from .tools import build_tool_handlers, parse_tool_arguments, tool_specs
+from .tools import TOOL_SPECS, build_tool_handlers
 
 
 DEFAULT_SYSTEM_PROMPT = """You are the Exocort notes agent.
@@ -67,10 +68,7 @@ WRITE_TOOL_NAMES = {"create_note", "replace_note", "append_note"}
 def run_notes_agent(notes: NotesSettings, batch: BatchCandidate) -> BatchRunResult:
     handlers = build_tool_handlers(notes.vault_dir)
     initial_list_result = handlers["list_notes"]({})
-    system_prompt = (notes.prompt.strip() or DEFAULT_SYSTEM_PROMPT).replace(
-        "{{language}}",
-        notes.language.strip() or "English",
-    )
+    system_prompt = _system_prompt(notes.prompt, notes.language)
     messages: list[dict[str, Any]] = [
         {"role": "system", "content": system_prompt},
         {
@@ -115,7 +113,7 @@ def run_notes_agent(notes: NotesSettings, batch: BatchCandidate) -> BatchRunResu
             ResponseRequest(
                 model=notes.model,
                 messages=tuple(messages),
-                tools=tuple(tool_specs()),
+                tools=TOOL_SPECS,
                 tool_choice="auto",
                 temperature=notes.temperature,
             )
@@ -123,8 +121,7 @@ def run_notes_agent(notes: NotesSettings, batch: BatchCandidate) -> BatchRunResu
         assistant_message = response.message
         messages.append(assistant_message)
 
-        tool_calls = assistant_message.get("tool_calls") or []
-        if not tool_calls:
+        if not response.tool_calls:
             if not had_write_tool:
                 messages.append(
                     {
@@ -142,10 +139,9 @@ def run_notes_agent(notes: NotesSettings, batch: BatchCandidate) -> BatchRunResu
                 tool_results=tuple(results),
             )
 
-        for tool_call in tool_calls:
-            function_call = tool_call.get("function") or {}
-            tool_name = str(function_call.get("name", "")).strip()
-            tool_call_id = str(tool_call.get("id") or uuid.uuid4().hex)
+        for tool_call in response.tool_calls:
+            tool_name = tool_call.name.strip()
+            tool_call_id = tool_call.id or secrets.token_hex(8)
             if tool_name not in handlers:
                 messages.append(
                     {
@@ -156,10 +152,8 @@ def run_notes_agent(notes: NotesSettings, batch: BatchCandidate) -> BatchRunResu
                     }
                 )
                 continue
-            raw_arguments = function_call.get("arguments", "{}")
             try:
-                parsed_arguments = parse_tool_arguments(raw_arguments)
-                result = handlers[tool_name](parsed_arguments)
+                result = handlers[tool_name](tool_call.arguments)
             except Exception as exc:
                 messages.append(
                     {
@@ -186,12 +180,21 @@ def run_notes_agent(notes: NotesSettings, batch: BatchCandidate) -> BatchRunResu
 
 
 def touched_note_paths(result: BatchRunResult) -> list[str]:
-    seen: list[str] = []
-    for tool_result in result.tool_results:
-        if tool_result.note_path is None or tool_result.note_path in seen:
-            continue
-        seen.append(tool_result.note_path)
-    return seen
+    return list(
+        dict.fromkeys(
+            tool_result.note_path
+            for tool_result in result.tool_results
+            if tool_result.note_path is not None
+        )
+    )
+
+
+@lru_cache(maxsize=8)
+def _system_prompt(prompt: str, language: str) -> str:
+    return (prompt.strip() or DEFAULT_SYSTEM_PROMPT).replace(
+        "{{language}}",
+        language.strip() or "English",
+    )
 
 
 def _assistant_text(message: dict[str, Any]) -> str:
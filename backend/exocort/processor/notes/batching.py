@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 
 from exocort.config import NotesSettings, ProcessorSettings
@@ -10,31 +13,68 @@ from exocort.bridge import approximate_token_count
 from .models import BatchCandidate, ProcessedArtifact
 from .state import completed_artifact_ids
 
+_empty_artifact_mtimes: dict[str, int] = {}
+
+
+class EmptyArtifactError(ValueError):
+    pass
+
 
 def discover_unprocessed_artifacts(config: ProcessorSettings) -> list[ProcessedArtifact]:
     done_ids = completed_artifact_ids(config.notes.state_dir)
     artifacts: list[ProcessedArtifact] = []
-    for json_path in sorted(config.output_dir.rglob("*.json")):
-        if not json_path.is_file():
-            continue
-        if json_path.name.endswith(".sensitive.json"):
-            continue
+    empty_mtimes: dict[str, int] = {}
+    for json_path in _iter_artifact_paths(config.output_dir):
         artifact_id = str(json_path.relative_to(config.output_dir))
-        if artifact_id.startswith("notes/"):
-            continue
         if artifact_id in done_ids:
             continue
+        try:
+            mtime_ns = json_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+        if _empty_artifact_mtimes.get(artifact_id) == mtime_ns:
+            empty_mtimes[artifact_id] = mtime_ns
+            continue
         try:
             artifact = load_artifact(config, json_path)
+        except EmptyArtifactError:
+            empty_mtimes[artifact_id] = mtime_ns
+            continue
         except Exception:
             continue
         artifacts.append(artifact)
+    _empty_artifact_mtimes.clear()
+    _empty_artifact_mtimes.update(empty_mtimes)
     artifacts.sort(key=lambda artifact: (artifact.captured_at, artifact.artifact_id))
     return artifacts
 
 
-def build_batch_candidate(notes: NotesSettings, artifacts: list[ProcessedArtifact]) -> BatchCandidate | None:
+def _iter_artifact_paths(output_dir: Path) -> list[Path]:
+    paths: list[Path] = []
+    pending = [output_dir]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if directory != output_dir or entry.name != "notes":
+                        pending.append(Path(entry.path))
+                elif (
+                    entry.name.endswith(".json")
+                    and not entry.name.endswith(".sensitive.json")
+                    and entry.is_file()
+                ):
+                    paths.append(Path(entry.path))
+    return paths
+
+
+def build_batch_candidate(notes: NotesSettings, artifacts: Iterable[ProcessedArtifact]) -> BatchCandidate | None:
     selected: list[ProcessedArtifact] = []
+    entries: list[str] = []
     selected_tokens = 0
 
     for artifact in artifacts:
@@ -43,6 +83,7 @@ def build_batch_candidate(notes: NotesSettings, artifacts: list[ProcessedArtifac
         if selected and selected_tokens + entry_tokens > notes.max_input_tokens:
             break
         selected.append(artifact)
+        entries.append(entry)
         selected_tokens += entry_tokens
         if selected_tokens >= notes.max_input_tokens:
             break
@@ -50,10 +91,9 @@ def build_batch_candidate(notes: NotesSettings, artifacts: list[ProcessedArtifac
     if not selected:
         return None
 
-    selected_tuple = tuple(selected)
     return BatchCandidate(
-        artifacts=selected_tuple,
-        input_text=_render_batch_content(selected_tuple),
+        artifacts=tuple(selected),
+        input_text=_render_batch_content(entries),
         input_tokens=selected_tokens,
     )
 
@@ -63,7 +103,7 @@ def build_batch_candidates(notes: NotesSettings, artifacts: list[ProcessedArtifa
     start_index = 0
 
     while start_index < len(artifacts):
-        candidate = build_batch_candidate(notes, artifacts[start_index:])
+        candidate = build_batch_candidate(notes, islice(artifacts, start_index, None))
         if candidate is None:
             break
         candidates.append(candidate)
@@ -80,7 +120,7 @@ def load_artifact(config: ProcessorSettings, json_path: Path) -> ProcessedArtifa
     artifact_id = str(json_path.relative_to(config.output_dir))
     text = str(payload.get("text", "")).strip()
     if not text:
-        raise ValueError("processed JSON text is empty")
+        raise EmptyArtifactError("processed JSON text is empty")
 
     source_kind = _source_kind(payload, artifact_id)
     source_relpath = payload.get("source_relpath")
@@ -121,10 +161,10 @@ def _captured_at(payload: dict[str, object], artifact_id: str) -> datetime:
     return datetime.strptime(timestamp, "%Y%m%dT%H%M%S%f").replace(tzinfo=timezone.utc)
 
 
-def _render_batch_content(artifacts: tuple[ProcessedArtifact, ...]) -> str:
+def _render_batch_content(entries: list[str]) -> str:
     blocks: list[str] = []
-    for index, artifact in enumerate(artifacts, start=1):
-        blocks.append(f"## Item {index}\n{_render_artifact_content(artifact)}")
+    for index, entry in enumerate(entries, start=1):
+        blocks.append(f"## Item {index}\n{entry}")
     return "\n\n".join(blocks).strip()
 
 
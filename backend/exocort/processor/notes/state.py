@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+from ..common import write_json_atomic
+
+STATE_SUBDIRS = ("batches", "errors")
+_manifest_cache: dict[Path, dict[str, tuple[str, ...]]] = {}
+
 
 def ensure_state_dirs(state_dir: Path) -> None:
-    (state_dir / "batches").mkdir(parents=True, exist_ok=True)
-    (state_dir / "errors").mkdir(parents=True, exist_ok=True)
+    try:
+        with os.scandir(state_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        state_dir.mkdir(parents=True)
+        existing = set()
+    for name in STATE_SUBDIRS:
+        if name not in existing:
+            (state_dir / name).mkdir(exist_ok=True)
 
 
 def completed_artifact_ids(state_dir: Path) -> set[str]:
@@ -15,21 +28,32 @@ def completed_artifact_ids(state_dir: Path) -> set[str]:
     if not batch_dir.exists():
         return set()
 
+    cache = _manifest_cache.setdefault(batch_dir, {})
     completed: set[str] = set()
-    for batch_path in sorted(batch_dir.glob("*.json")):
-        try:
-            payload = json.loads(batch_path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        if payload.get("status") != "completed":
-            continue
-        artifact_ids = payload.get("artifact_ids")
-        if not isinstance(artifact_ids, list):
-            continue
-        completed.update(str(value) for value in artifact_ids)
+    for batch_path in batch_dir.glob("*.json"):
+        artifact_ids = cache.get(batch_path.name)
+        if artifact_ids is None:
+            artifact_ids = _completed_manifest_ids(batch_path)
+            if artifact_ids is None:
+                continue
+            cache[batch_path.name] = artifact_ids
+        completed.update(artifact_ids)
     return completed
 
 
+def _completed_manifest_ids(batch_path: Path) -> tuple[str, ...] | None:
+    try:
+        payload = json.loads(batch_path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get("status") != "completed":
+        return ()
+    artifact_ids = payload.get("artifact_ids")
+    if not isinstance(artifact_ids, list):
+        return ()
+    return tuple(str(value) for value in artifact_ids)
+
+
 def write_batch_manifest(
     state_dir: Path,
     *,
@@ -56,7 +80,7 @@ def write_batch_manifest(
         "error": error,
     }
     manifest_path = state_dir / "batches" / f"{batch_id}.json"
-    manifest_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_json_atomic(manifest_path, payload)
     return manifest_path
 
 
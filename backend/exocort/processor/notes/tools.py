@@ -12,64 +12,74 @@ from . import vault
 ToolHandler = Callable[[dict[str, Any]], ToolCallResult]
 
 
-def tool_specs() -> list[dict[str, Any]]:
-    return [
-        _function_tool(
-            "list_notes",
-            "List markdown notes available inside the vault with their summaries so you can reuse existing thematic notes.",
-            {"type": "object", "properties": {}, "additionalProperties": False},
-        ),
-        _function_tool(
-            "read_note",
-            "Read one markdown note from the vault.",
-            {
-                "type": "object",
-                "properties": {"path": {"type": "string"}},
-                "required": ["path"],
-                "additionalProperties": False,
-            },
-        ),
-        _function_tool(
-            "create_note",
-            "Create a new markdown note in the vault.",
-            {
-                "type": "object",
-                "properties": {"path": {"type": "string"}, "content": {"type": "string"}},
-                "required": ["path", "content"],
-                "additionalProperties": False,
-            },
-        ),
-        _function_tool(
-            "replace_note",
-            "Replace a markdown note in the vault.",
-            {
-                "type": "object",
-                "properties": {"path": {"type": "string"}, "content": {"type": "string"}},
-                "required": ["path", "content"],
-                "additionalProperties": False,
-            },
-        ),
-        _function_tool(
-            "append_note",
-            "Append content to a markdown note in the vault. Use sparingly, mainly for a short incremental update section.",
-            {
-                "type": "object",
-                "properties": {"path": {"type": "string"}, "content": {"type": "string"}},
-                "required": ["path", "content"],
-                "additionalProperties": False,
-            },
-        ),
-        _function_tool(
-            "delete_note",
-            "Delete a markdown note in the vault.",
-            {
-                "type": "object",
-                "properties": {"path": {"type": "string"}},
-                "required": ["path"],
-                "additionalProperties": False,
-            },
-        ),
-    ]
+def _function_tool(name: str, description: str, parameters: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": description,
+            "parameters": parameters,
+        },
+    }
+
+
+TOOL_SPECS: tuple[dict[str, Any], ...] = (
+    _function_tool(
+        "list_notes",
+        "List markdown notes available inside the vault with their summaries so you can reuse existing thematic notes.",
+        {"type": "object", "properties": {}, "additionalProperties": False},
+    ),
+    _function_tool(
+        "read_note",
+        "Read one markdown note from the vault.",
+        {
+            "type": "object",
+            "properties": {"path": {"type": "string"}},
+            "required": ["path"],
+            "additionalProperties": False,
+        },
+    ),
+    _function_tool(
+        "create_note",
+        "Create a new markdown note in the vault.",
+        {
+            "type": "object",
+            "properties": {"path": {"type": "string"}, "content": {"type": "string"}},
+            "required": ["path", "content"],
+            "additionalProperties": False,
+        },
+    ),
+    _function_tool(
+        "replace_note",
+        "Replace a markdown note in the vault.",
+        {
+            "type": "object",
+            "properties": {"path": {"type": "string"}, "content": {"type": "string"}},
+            "required": ["path", "content"],
+            "additionalProperties": False,
+        },
+    ),
+    _function_tool(
+        "append_note",
+        "Append content to a markdown note in the vault. Use sparingly, mainly for a short incremental update section.",
+        {
+            "type": "object",
+            "properties": {"path": {"type": "string"}, "content": {"type": "string"}},
+            "required": ["path", "content"],
+            "additionalProperties": False,
+        },
+    ),
+    _function_tool(
+        "delete_note",
+        "Delete a markdown note in the vault.",
+        {
+            "type": "object",
+            "properties": {"path": {"type": "string"}},
+            "required": ["path"],
+            "additionalProperties": False,
+        },
+    ),
+)
 
 
 def build_tool_handlers(vault_dir: Path) -> dict[str, ToolHandler]:
@@ -116,29 +126,6 @@ def build_tool_handlers(vault_dir: Path) -> dict[str, ToolHandler]:
     }
 
 
-def parse_tool_arguments(raw_arguments: object) -> dict[str, Any]:
-    if isinstance(raw_arguments, str):
-        payload = json.loads(raw_arguments or "{}")
-    elif isinstance(raw_arguments, dict):
-        payload = raw_arguments
-    else:
-        raise ValueError("tool arguments must be a JSON object")
-    if not isinstance(payload, dict):
-        raise ValueError("tool arguments must decode to an object")
-    return payload
-
-
-def _function_tool(name: str, description: str, parameters: dict[str, Any]) -> dict[str, Any]:
-    return {
-        "type": "function",
-        "function": {
-            "name": name,
-            "description": description,
-            "parameters": parameters,
-        },
-    }
-
-
 def _normalize_note_path(raw_path: object) -> str:
     path = str(raw_path).strip()
     if not path:
@@ -149,8 +136,9 @@ def _normalize_note_path(raw_path: object) -> str:
 
 
 def _write_result(tool_name: str, note_path: Path, vault_dir: Path) -> ToolCallResult:
+    relative_path = str(note_path.relative_to(vault_dir))
     return ToolCallResult(
         tool_name=tool_name,
-        summary=f"{tool_name} ok: {note_path.relative_to(vault_dir)}",
-        note_path=str(note_path.relative_to(vault_dir)),
+        summary=f"{tool_name} ok: {relative_path}",
+        note_path=relative_path,
     )
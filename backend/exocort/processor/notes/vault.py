@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import TextIO
+
+NOTE_SUMMARY_CACHE_SIZE = 4096
+WHITESPACE_RE = re.compile(r"\s+")
 
 
 def resolve_note_path(vault_dir: Path, relative_path: str) -> Path:
@@ -9,100 +15,134 @@ def resolve_note_path(vault_dir: Path, relative_path: str) -> Path:
     if clean_path.is_absolute():
         raise ValueError("note path must be relative to vault_dir")
     resolved = (vault_dir / clean_path).resolve()
-    vault_root = vault_dir.resolve()
-    if resolved != vault_root and vault_root not in resolved.parents:
+    vault_root = _resolved_vault_root(vault_dir)
+    if not resolved.is_relative_to(vault_root):
         raise ValueError("note path escapes vault_dir")
     if resolved.suffix.lower() != ".md":
         raise ValueError("note path must end with .md")
     return resolved
 
 
+@lru_cache(maxsize=8)
+def _resolved_vault_root(vault_dir: Path) -> Path:
+    return vault_dir.resolve()
+
+
 def create_note(vault_dir: Path, relative_path: str, content: str) -> Path:
     note_path = resolve_note_path(vault_dir, relative_path)
-    note_path.parent.mkdir(parents=True, exist_ok=True)
-    if note_path.exists():
-        raise ValueError(f"note already exists: {relative_path}")
-    note_path.write_text(content, encoding="utf-8")
+    try:
+        with _open_note(note_path, "x") as handle:
+            handle.write(content)
+    except FileExistsError:
+        raise ValueError(f"note already exists: {relative_path}") from None
     return note_path
 
 
 def replace_note(vault_dir: Path, relative_path: str, content: str) -> Path:
     note_path = resolve_note_path(vault_dir, relative_path)
-    note_path.parent.mkdir(parents=True, exist_ok=True)
-    note_path.write_text(content, encoding="utf-8")
+    with _open_note(note_path, "w") as handle:
+        handle.write(content)
     return note_path
 
 
 def append_note(vault_dir: Path, relative_path: str, content: str) -> Path:
     note_path = resolve_note_path(vault_dir, relative_path)
-    note_path.parent.mkdir(parents=True, exist_ok=True)
-    if note_path.exists():
-        previous = note_path.read_text(encoding="utf-8")
-        note_path.write_text(previous + content, encoding="utf-8")
-    else:
-        note_path.write_text(content, encoding="utf-8")
+    with _open_note(note_path, "a") as handle:
+        handle.write(content)
     return note_path
 
 
+def _open_note(note_path: Path, mode: str) -> TextIO:
+    try:
+        return note_path.open(mode, encoding="utf-8")
+    except FileNotFoundError:
+        note_path.parent.mkdir(parents=True, exist_ok=True)
+        return note_path.open(mode, encoding="utf-8")
+
+
 def delete_note(vault_dir: Path, relative_path: str) -> Path:
     note_path = resolve_note_path(vault_dir, relative_path)
-    if not note_path.exists():
-        raise ValueError(f"note does not exist: {relative_path}")
-    note_path.unlink()
+    try:
+        note_path.unlink()
+    except FileNotFoundError:
+        raise ValueError(f"note does not exist: {relative_path}") from None
     return note_path
 
 
 def read_note(vault_dir: Path, relative_path: str) -> str:
     note_path = resolve_note_path(vault_dir, relative_path)
-    if not note_path.exists():
-        raise ValueError(f"note does not exist: {relative_path}")
-    return note_path.read_text(encoding="utf-8")
+    try:
+        return note_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise ValueError(f"note does not exist: {relative_path}") from None
 
 
 def list_notes(vault_dir: Path) -> list[dict[str, str]]:
-    if not vault_dir.exists():
-        return []
     notes: list[dict[str, str]] = []
-    for path in sorted(p for p in vault_dir.rglob("*.md") if p.is_file()):
+    for path, entry in sorted(_iter_note_entries(vault_dir), key=lambda item: item[0]):
+        stat = entry.stat()
         notes.append(
             {
                 "path": str(path.relative_to(vault_dir)),
-                "summary": _extract_note_summary(path),
+                "summary": _cached_note_summary(path, stat.st_mtime_ns, stat.st_size),
             }
         )
     return notes
 
 
+def _iter_note_entries(vault_dir: Path) -> list[tuple[Path, os.DirEntry[str]]]:
+    entries: list[tuple[Path, os.DirEntry[str]]] = []
+    pending = [vault_dir]
+    while pending:
+        try:
+            scanner = os.scandir(pending.pop())
+        except FileNotFoundError:
+            continue
+        with scanner:
+            for entry in scanner:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.name.endswith(".md") and entry.is_file():
+                    entries.append((Path(entry.path), entry))
+    return entries
+
+
+@lru_cache(maxsize=NOTE_SUMMARY_CACHE_SIZE)
+def _cached_note_summary(note_path: Path, mtime_ns: int, size: int) -> str:
+    return _extract_note_summary(note_path)
+
+
 def _extract_note_summary(note_path: Path) -> str:
-    lines = note_path.read_text(encoding="utf-8").splitlines()
     summary_lines: list[str] = []
+    first_text_line = ""
     in_summary = False
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("## "):
+    summary_done = False
+
+    with note_path.open(encoding="utf-8") as handle:
+        for line in handle:
+            stripped = line.strip()
+            if not first_text_line and stripped and not stripped.startswith("#"):
+                first_text_line = stripped
+            if summary_done:
+                if summary_lines or first_text_line:
+                    break
+                continue
+            if stripped.startswith("## "):
+                if in_summary:
+                    summary_done = True
+                elif stripped.lower() == "## summary":
+                    in_summary = True
+                continue
             if in_summary:
-                break
-            if stripped.lower() == "## summary":
-                in_summary = True
-            continue
-        if in_summary:
-            if stripped:
-                summary_lines.append(stripped)
-            elif summary_lines:
-                break
+                if stripped:
+                    summary_lines.append(stripped)
+                elif summary_lines:
+                    summary_done = True
 
     if summary_lines:
         return _compress_text(" ".join(summary_lines))
-
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        return _compress_text(stripped)
-
-    return ""
+    return _compress_text(first_text_line)
 
 
 def _compress_text(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_RE.sub(" ", text).strip()
@@ -1,4 +0,0 @@
-from .models import OcrPage, OcrResponse
-from .service import ocr_text, parse_ocr_response
-
-__all__ = ["OcrPage", "OcrResponse", "ocr_text", "parse_ocr_response"]
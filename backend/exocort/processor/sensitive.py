@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from exocort.config import ContentFilterSettings
 
@@ -17,21 +18,32 @@ def detect_content_match(config: ContentFilterSettings, text: str) -> ContentMat
     if not config.enabled:
         return None
 
-    normalized_text = text.casefold()
+    normalized_text: str | None = None
     for rule in config.rules:
-        for keyword in rule.keywords:
-            normalized_keyword = keyword.casefold()
+        for keyword, normalized_keyword in _casefold_keywords(rule.keywords):
+            if normalized_text is None:
+                normalized_text = text.casefold()
             if normalized_keyword in normalized_text:
                 return ContentMatch(
                     rule_name=rule.name,
                     match_type="keyword",
                     pattern=keyword,
                 )
-        for regex in rule.regexes:
-            if re.search(regex, text, re.IGNORECASE):
+        for regex in _compile_regexes(rule.regexes):
+            if regex.search(text):
                 return ContentMatch(
                     rule_name=rule.name,
                     match_type="regex",
-                    pattern=regex,
+                    pattern=regex.pattern,
                 )
     return None
+
+
+@lru_cache(maxsize=None)
+def _casefold_keywords(keywords: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    return tuple((keyword, keyword.casefold()) for keyword in keywords)
+
+
+@lru_cache(maxsize=None)
+def _compile_regexes(regexes: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    return tuple(re.compile(regex, re.IGNORECASE) for regex in regexes)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
+import os
 import queue
 import threading
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from watchdog.events import (
@@ -19,17 +20,17 @@ from exocort.config import EndpointSettings, ExocortSettings, ProcessorSettings
 from exocort.logs import get_logger
 from exocort.bridge import AsrRequest, MediaInput, OcrRequest, ProviderBridge, ProviderConfig
 
-from .asr.service import asr_text
+from .common import write_json_atomic
 from .notes import run_notes_loop
-from .ocr.service import ocr_text
 from .retention import schedule_file_deletion
 from .sensitive import ContentMatch, detect_content_match
 
-IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif", ".tif", ".tiff"}
-AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".mp4", ".mpeg", ".mpga", ".webm", ".ogg"}
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif", ".tif", ".tiff"})
+AUDIO_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a", ".mp4", ".mpeg", ".mpga", ".webm", ".ogg"})
 SUPPORTED_EXTENSIONS = IMAGE_EXTENSIONS | AUDIO_EXTENSIONS
 QUEUE_TIMEOUT_SECONDS = 0.5
 log = get_logger("processor")
+_known_output_dirs: set[Path] = set()
 
 
 def processing_loop(config: ExocortSettings) -> None:
@@ -77,7 +78,7 @@ def _run_file_processor_loop(config: ExocortSettings) -> None:
         processor.output_dir,
     )
 
-    event_queue: queue.Queue[Path] = queue.Queue()
+    event_queue: queue.SimpleQueue[Path] = queue.SimpleQueue()
     event_handler = _QueuedPathHandler(event_queue)
     worker_queues = _start_processing_workers(config, event_handler)
 
@@ -107,7 +108,7 @@ def _run_file_processor_loop(config: ExocortSettings) -> None:
 def queue_existing_files(
     config: ExocortSettings,
     event_handler: "_QueuedPathHandler",
-    worker_queues: dict[str, queue.Queue[Path]],
+    worker_queues: dict[str, queue.SimpleQueue[Path]],
 ) -> int:
     queued = 0
     for file_path in _iter_supported_files(config.processor.watch_dir):
@@ -118,11 +119,21 @@ def queue_existing_files(
 
 
 def _iter_supported_files(root: Path) -> list[Path]:
-    return sorted(
-        path
-        for path in root.rglob("*")
-        if _is_supported_visible_file(path)
-    )
+    files: list[Path] = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.is_file() and _is_supported_visible_name(entry.name):
+                    files.append(Path(entry.path))
+    return sorted(files)
 
 
 def _process_file_if_supported(config: ExocortSettings, file_path: Path) -> bool:
@@ -142,7 +153,7 @@ def _process_file_if_supported(config: ExocortSettings, file_path: Path) -> bool
         log.debug("skipping path=%s reason=already_processed", file_path.name)
         return False
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_output_dir(output_path.parent)
     try:
         log.debug(
             "processing path=%s kind=%s model=%s",
@@ -163,13 +174,9 @@ def _process_file_if_supported(config: ExocortSettings, file_path: Path) -> bool
 
     content_match = detect_content_match(processor.content_filter, text)
     if content_match is not None:
-        sensitive_marker_path.write_text(
-            json.dumps(
-                _build_sensitive_marker_payload(processor, file_path, content_match),
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
+        write_json_atomic(
+            sensitive_marker_path,
+            _build_sensitive_marker_payload(processor, file_path, content_match),
         )
         log.warning(
             "blocked sensitive %s output for %s with rule=%s match_type=%s",
@@ -185,10 +192,7 @@ def _process_file_if_supported(config: ExocortSettings, file_path: Path) -> bool
         )
         return True
 
-    output_path.write_text(
-        json.dumps(_build_output_payload(processor, file_path, text), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    write_json_atomic(output_path, _build_output_payload(processor, file_path, text))
     log.info("saved %s -> %s", file_path, output_path)
     schedule_file_deletion(
         file_path,
@@ -198,32 +202,32 @@ def _process_file_if_supported(config: ExocortSettings, file_path: Path) -> bool
     return True
 
 
+def _ensure_output_dir(directory: Path) -> None:
+    if directory in _known_output_dirs:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _known_output_dirs.add(directory)
+
+
 def _start_processing_workers(
     config: ExocortSettings,
     event_handler: "_QueuedPathHandler",
-) -> dict[str, queue.Queue[Path]]:
-    worker_queues: dict[str, queue.Queue[Path]] = {}
+) -> dict[str, queue.SimpleQueue[Path]]:
+    worker_queues: dict[str, queue.SimpleQueue[Path]] = {}
     processor = config.processor
 
-    if processor.ocr.enabled:
-        ocr_queue: queue.Queue[Path] = queue.Queue()
-        worker_queues["ocr"] = ocr_queue
-        threading.Thread(
-            target=_processing_worker_loop,
-            args=(config, ocr_queue, event_handler, "ocr"),
-            name="ocr-worker",
-            daemon=True,
-        ).start()
-
-    if processor.asr.enabled:
-        asr_queue: queue.Queue[Path] = queue.Queue()
-        worker_queues["asr"] = asr_queue
-        threading.Thread(
-            target=_processing_worker_loop,
-            args=(config, asr_queue, event_handler, "asr"),
-            name="asr-worker",
-            daemon=True,
-        ).start()
+    for kind, endpoint in (("ocr", processor.ocr), ("asr", processor.asr)):
+        if not endpoint.enabled:
+            continue
+        work_queue: queue.SimpleQueue[Path] = queue.SimpleQueue()
+        worker_queues[kind] = work_queue
+        for index in range(endpoint.max_concurrent_requests):
+            threading.Thread(
+                target=_processing_worker_loop,
+                args=(config, work_queue, event_handler, kind),
+                name=f"{kind}-worker-{index}",
+                daemon=True,
+            ).start()
 
     return worker_queues
 
@@ -231,7 +235,7 @@ def _start_processing_workers(
 def _dispatch_file_path(
     config: ExocortSettings,
     file_path: Path,
-    worker_queues: dict[str, queue.Queue[Path]],
+    worker_queues: dict[str, queue.SimpleQueue[Path]],
     *,
     source: str,
 ) -> None:
@@ -245,7 +249,7 @@ def _dispatch_file_path(
 
 def _processing_worker_loop(
     config: ExocortSettings,
-    work_queue: queue.Queue[Path],
+    work_queue: queue.SimpleQueue[Path],
     event_handler: "_QueuedPathHandler",
     kind: str,
 ) -> None:
@@ -361,11 +365,14 @@ def _captured_at_from_path(file_path: Path) -> datetime:
 
 
 def _is_supported_visible_file(file_path: Path) -> bool:
-    return (
-        file_path.is_file()
-        and not file_path.name.startswith(".")
-        and file_path.suffix.lower() in SUPPORTED_EXTENSIONS
-    )
+    return file_path.is_file() and _is_supported_visible_name(file_path.name)
+
+
+def _is_supported_visible_name(name: str) -> bool:
+    if name.startswith("."):
+        return False
+    _stem, dot, extension = name.rpartition(".")
+    return bool(dot) and f".{extension.lower()}" in SUPPORTED_EXTENSIONS
 
 
 def _process_ocr_file(file_path: Path, endpoint: EndpointSettings) -> str:
@@ -379,6 +386,7 @@ def _process_ocr_file(file_path: Path, endpoint: EndpointSettings) -> str:
             api_key_env=endpoint.api_key_env,
             timeout_s=endpoint.timeout_s,
             retries=endpoint.retries,
+            max_concurrent_requests=endpoint.max_concurrent_requests,
         )
     )
     response = bridge.ocr(
@@ -389,7 +397,7 @@ def _process_ocr_file(file_path: Path, endpoint: EndpointSettings) -> str:
             prompt=prompt or None,
         )
     )
-    return ocr_text({"pages": [{"index": page.index, "markdown": page.text} for page in response.pages]})
+    return "\n".join(page.text for page in response.pages)
 
 
 def _process_asr_file(file_path: Path, endpoint: EndpointSettings) -> str:
@@ -403,6 +411,7 @@ def _process_asr_file(file_path: Path, endpoint: EndpointSettings) -> str:
             api_key_env=endpoint.api_key_env,
             timeout_s=endpoint.timeout_s,
             retries=endpoint.retries,
+            max_concurrent_requests=endpoint.max_concurrent_requests,
         )
     )
     response = bridge.asr(
@@ -414,15 +423,16 @@ def _process_asr_file(file_path: Path, endpoint: EndpointSettings) -> str:
             prompt=prompt or None,
         )
     )
-    return asr_text({"text": response.text})
+    return response.text
 
 
+@lru_cache(maxsize=8)
 def _prompt_with_language(prompt: str, language: str) -> str:
     return prompt.replace("{{language}}", language.strip() or "English").strip()
 
 
 class _QueuedPathHandler(FileSystemEventHandler):
-    def __init__(self, event_queue: queue.Queue[Path]) -> None:
+    def __init__(self, event_queue: queue.SimpleQueue[Path]) -> None:
         super().__init__()
         self._event_queue = event_queue
         self._queued: set[Path] = set()
@@ -439,7 +449,7 @@ class _QueuedPathHandler(FileSystemEventHandler):
         self._queue_path(Path(event.dest_path))
 
     def mark_done(self, file_path: Path) -> None:
-        resolved = file_path.resolve()
+        resolved = file_path if file_path in self._queued else file_path.resolve()
         self._queued.discard(resolved)
         log.debug("marked done path=%s", resolved.name)
 
@@ -456,11 +466,9 @@ class _QueuedPathHandler(FileSystemEventHandler):
         self._queue_path(Path(event.src_path))
 
     def _queue_path(self, file_path: Path) -> None:
-        resolved = file_path.expanduser().resolve()
-        if resolved.name.startswith("."):
-            return
-        if resolved.suffix.lower() not in SUPPORTED_EXTENSIONS:
+        if not _is_supported_visible_name(file_path.name):
             return
+        resolved = file_path.expanduser().resolve()
         if resolved in self._queued:
             log.debug("ignoring duplicate event path=%s", resolved.name)
             return
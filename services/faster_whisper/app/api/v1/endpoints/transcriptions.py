@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-from pathlib import Path
-from tempfile import gettempdir
-from uuid import uuid4
+import asyncio
 
 from fastapi import APIRouter, Depends, File, UploadFile
 from starlette.responses import Response
 
 from common.models.asr import TranscriptionRequest, TranscriptionResponse
-from src.transcription import transcribe_path
+from src.transcription import transcribe_file
 
 router = APIRouter()
 
@@ -18,21 +16,12 @@ async def transcribe_audio(
     file: UploadFile = File(...),
     payload: TranscriptionRequest = Depends(TranscriptionRequest.as_form),
 ) -> TranscriptionResponse | Response:
-
-    tmp_path = Path(gettempdir()) / f"{uuid4().hex}-{file.filename or 'audio'}"
-    try:
-        tmp_path.write_bytes(await file.read())
-        result = transcribe_path(
-            tmp_path,
-            language=payload.language,
-            prompt=payload.prompt,
-        )
-        if result is None:
-            return Response(status_code=204)
-        return result
-    finally:
-        try:
-            if tmp_path.exists():
-                tmp_path.unlink()
-        except Exception:
-            pass
+    result = await asyncio.to_thread(
+        transcribe_file,
+        file.file,
+        language=payload.language,
+        prompt=payload.prompt,
+    )
+    if result is None:
+        return Response(status_code=204)
+    return result
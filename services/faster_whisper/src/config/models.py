@@ -14,5 +14,10 @@ class FasterWhisperSettings:
     model_path: Path
     device: str
     compute_type: str
+    cpu_threads: int
+    num_workers: int
     beam_size: int
+    temperature: float
+    vad_filter: bool
+    condition_on_previous_text: bool
     language: str | None
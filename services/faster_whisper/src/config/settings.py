@@ -4,29 +4,35 @@ import os
 from functools import lru_cache
 from pathlib import Path
 
-from common.utils.yaml import load_yaml_config
+from common.utils.yaml import load_yaml_config, resolve_config_path
 
 from .models import FasterWhisperSettings
 
 
 @lru_cache(maxsize=1)
 def load_settings() -> FasterWhisperSettings:
-    config = load_yaml_config(Path(__file__).resolve().parents[2] / "config.yaml")
+    config_path = Path(__file__).resolve().parents[2] / "config.yaml"
+    config = load_yaml_config(config_path)
     language = str(config.get("language", "")).strip() or None
     if language and language.lower() == "auto":
         language = None
     model_size = str(config.get("model_size", "medium")).strip() or "medium"
-    model_path = resolve_config_path(config_dir, config.get("model_path"), "models")
+    model_path = resolve_config_path(config_path.parent, config.get("model_path"), "models")
 
     return FasterWhisperSettings(
         host=str(config.get("host", "127.0.0.1")).strip(),
         port=int(config.get("port", 9000)),
-        reload=bool(config.get("reload", True)),
+        reload=bool(config.get("reload", False)),
         log_level=str(config.get("log_level", "info")).lower().strip(),
         model_size=model_size,
         model_path=model_path,
         device=str(config.get("device", "cpu")).strip(),
-        compute_type=str(config.get("compute_type", "int8")).strip(),
-        beam_size=int(config.get("beam_size", 5)),
+        compute_type=str(config.get("compute_type", "auto")).strip(),
+        cpu_threads=int(config.get("cpu_threads", max(1, (os.cpu_count() or 2) // 2))),
+        num_workers=int(config.get("num_workers", 1)),
+        beam_size=int(config.get("beam_size", 1)),
+        temperature=float(config.get("temperature", 0.0)),
+        vad_filter=bool(config.get("vad_filter", True)),
+        condition_on_previous_text=bool(config.get("condition_on_previous_text", False)),
         language=language,
     )
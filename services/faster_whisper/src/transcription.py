@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import threading
 from pathlib import Path
+from typing import BinaryIO
 
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, decode_audio
 from faster_whisper.utils import download_model
 
 from common.models.asr import TranscriptionResponse
@@ -42,14 +43,18 @@ def startup() -> None:
             resolved_model_path,
             device=settings.device,
             compute_type=settings.compute_type,
+            cpu_threads=settings.cpu_threads,
+            num_workers=settings.num_workers,
         )
         log.info(
-            "Loaded faster-whisper model | model_size=%s | model_path=%s | resolved_model_path=%s | device=%s | compute_type=%s",
+            "Loaded faster-whisper model | model_size=%s | model_path=%s | resolved_model_path=%s | device=%s | compute_type=%s | cpu_threads=%s | num_workers=%s",
             settings.model_size,
             settings.model_path,
             resolved_model_path,
             settings.device,
             settings.compute_type,
+            settings.cpu_threads,
+            settings.num_workers,
         )
     except Exception:
         log.exception("Failed to load faster-whisper model")
@@ -60,8 +65,8 @@ def health() -> HealthResponse:
     return HealthResponse(ok=_model is not None)
 
 
-def transcribe_path(
-    path: Path,
+def transcribe_file(
+    audio: BinaryIO,
     *,
     language: str | None,
     prompt: str | None,
@@ -70,12 +75,16 @@ def transcribe_path(
         raise RuntimeError("model not loaded")
 
     settings = load_settings()
+    samples = decode_audio(audio, sampling_rate=_model.feature_extractor.sampling_rate)
     with _model_lock:
         segments, _info = _model.transcribe(
-            str(path),
+            samples,
             beam_size=settings.beam_size,
+            temperature=settings.temperature,
             language=language or settings.language,
             initial_prompt=prompt or None,
+            vad_filter=settings.vad_filter,
+            condition_on_previous_text=settings.condition_on_previous_text,
         )
 
     text_parts: list[str] = [segment.text.strip() for segment in segments if segment.text]
@@ -89,4 +98,4 @@ def transcribe_path(
     )
 
 
-__all__ = ["health", "startup", "transcribe_path"]
+__all__ = ["health", "startup", "transcribe_file"]
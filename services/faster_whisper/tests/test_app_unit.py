@@ -15,8 +15,8 @@ pytestmark = [pytest.mark.service, pytest.mark.unit]
 
 def test_transcribe_audio_returns_joined_text(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        "services.faster_whisper.app.api.v1.endpoints.transcriptions.transcribe_path",
-        lambda path, language, prompt: TranscriptionResponse(
+        "services.faster_whisper.app.api.v1.endpoints.transcriptions.transcribe_file",
+        lambda audio, language, prompt: TranscriptionResponse(
             text="hello world",
             language=language or "en",
             duration=None,
@@ -14,8 +14,9 @@ def test_load_settings_reads_yaml() -> None:
     load_settings.cache_clear()
 
     settings = load_settings()
-    assert settings.model_path == "medium"
-    assert settings.beam_size == 5
+    assert settings.model_size == "medium"
+    assert settings.model_path == Path(__file__).resolve().parents[1] / "models"
+    assert settings.beam_size == 1
     assert settings.language is None
 
 
@@ -33,6 +34,7 @@ def test_load_settings_defaults_when_config_is_missing(
 
     settings = load_settings()
 
-    assert settings.model_path == "medium"
+    assert settings.model_size == "medium"
+    assert settings.model_path == Path(__file__).resolve().parents[1] / "models"
     assert settings.device == "cpu"
     assert settings.language is None
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import json
+import logging
 import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from collections.abc import Mapping
 
 from fastapi import HTTPException
 from huggingface_hub import hf_hub_download
-from llama_cpp import Llama
+from llama_cpp import GGML_TYPE_Q4_0, GGML_TYPE_Q8_0, Llama, LlamaGrammar, LlamaRAMCache
 from llama_cpp.llama_chat_format import Jinja2ChatFormatter
 
 from common.models.chat import (
@@ -25,8 +27,11 @@ from ..config.models import LlamaCppSettings
 from ..config.settings import load_chat_template, load_settings
 
 log = get_logger("llama_cpp", "chat")
+GRAMMAR_CACHE_SIZE = 32
+KV_CACHE_GGML_TYPES = {"q8_0": GGML_TYPE_Q8_0, "q4_0": GGML_TYPE_Q4_0}
 _settings: LlamaCppSettings | None = None
 _llama: Llama | None = None
+_load_error: str | None = None
 _llama_lock = threading.Lock()
 
 
@@ -39,22 +44,49 @@ def _token_text(llama: Llama, token_id: int) -> str:
 
 
 def _build_chat_handler(template: str):
+    formatter = None
+
     def chat_handler(
         *,
         llama: Llama,
         messages: list[dict[str, object]],
         **kwargs: object,
     ) -> object:
-        formatter = Jinja2ChatFormatter(
-            template=template,
-            eos_token=_token_text(llama, llama.token_eos()),
-            bos_token=_token_text(llama, llama.token_bos()),
-        ).to_chat_handler()
+        nonlocal formatter
+        if formatter is None:
+            formatter = Jinja2ChatFormatter(
+                template=template,
+                eos_token=_token_text(llama, llama.token_eos()),
+                bos_token=_token_text(llama, llama.token_bos()),
+            ).to_chat_handler()
         return formatter(llama=llama, messages=messages, **kwargs)
 
     return chat_handler
 
 
+@lru_cache(maxsize=GRAMMAR_CACHE_SIZE)
+def _grammar_for_schema(schema: str) -> LlamaGrammar:
+    return LlamaGrammar.from_json_schema(schema, verbose=False)
+
+
+def _response_format_grammar(response_format: Mapping[str, object]) -> LlamaGrammar | None:
+    format_type = response_format.get("type")
+    if format_type == "json_schema":
+        json_schema = response_format.get("json_schema")
+        schema = json_schema.get("schema") if isinstance(json_schema, Mapping) else None
+    elif format_type == "json_object":
+        schema = response_format.get("schema")
+    else:
+        return None
+    if not isinstance(schema, Mapping):
+        return None
+    try:
+        return _grammar_for_schema(json.dumps(schema, sort_keys=True))
+    except Exception:
+        log.warning("Unsupported response_format schema, falling back to response_format")
+        return None
+
+
 def _normalize_tool_calls(tool_calls: object) -> object:
     if not isinstance(tool_calls, list):
         return tool_calls
@@ -105,24 +137,33 @@ def _ensure_model_path(settings: LlamaCppSettings) -> Path:
     return local_path
 
 
-def _load_llama(settings: LlamaCppSettings) -> Llama:
-    model_path = _ensure_model_path(settings)
+def _load_llama(settings: LlamaCppSettings, model_path: Path) -> Llama:
     kwargs: dict[str, object] = {
         "model_path": str(model_path),
         "n_ctx": settings.n_ctx,
         "n_gpu_layers": settings.n_gpu_layers,
         "n_batch": settings.n_batch,
+        "n_ubatch": settings.n_ubatch,
         "seed": settings.seed,
         "verbose": False,
     }
     if settings.n_threads > 0:
         kwargs["n_threads"] = settings.n_threads
+    if settings.flash_attn:
+        kwargs["flash_attn"] = True
+    kv_cache_type = KV_CACHE_GGML_TYPES.get(settings.kv_cache_type)
+    if kv_cache_type is not None:
+        kwargs["type_k"] = kv_cache_type
+        kwargs["type_v"] = kv_cache_type
     chat_template = load_chat_template(settings.chat_format)
     if chat_template is not None:
         kwargs["chat_handler"] = _build_chat_handler(chat_template)
     else:
         kwargs["chat_format"] = settings.chat_format
-    return Llama(**kwargs)
+    llama = Llama(**kwargs)
+    if settings.cache_size_mb > 0:
+        llama.set_cache(LlamaRAMCache(capacity_bytes=settings.cache_size_mb << 20))
+    return llama
 
 
 def _normalize_messages(messages: list[ChatMessage]) -> list[dict[str, object]]:
@@ -150,7 +191,7 @@ def _normalize_messages(messages: list[ChatMessage]) -> list[dict[str, object]]:
 
 
 def startup() -> None:
-    global _settings, _llama
+    global _settings
     _settings = load_settings()
     log.info(
         "Starting llama.cpp service | model_id=%s | model_dir=%s | chat_format=%s",
@@ -158,28 +199,40 @@ def startup() -> None:
         _settings.model_dir,
         _settings.chat_format,
     )
+    threading.Thread(target=_warm_up, args=(_settings,), name="llama-warmup", daemon=True).start()
+
+
+def _warm_up(settings: LlamaCppSettings) -> None:
+    global _llama, _load_error
     try:
-        _llama = _load_llama(_settings)
+        model_path = _ensure_model_path(settings)
+        _llama = _load_llama(settings, model_path)
         log.info(
             "Loaded llama.cpp model | path=%s | model_id=%s | quantization=%s | n_ctx=%s | n_gpu_layers=%s | n_threads=%s | n_batch=%s",
-            _ensure_model_path(_settings),
-            _settings.model_id,
-            _settings.quantization,
-            _settings.n_ctx,
-            _settings.n_gpu_layers,
-            _settings.n_threads,
-            _settings.n_batch,
+            model_path,
+            settings.model_id,
+            settings.quantization,
+            settings.n_ctx,
+            settings.n_gpu_layers,
+            settings.n_threads,
+            settings.n_batch,
         )
-    except Exception:
+    except Exception as exc:
+        _load_error = str(exc) or type(exc).__name__
         log.exception(
             "Failed to load llama.cpp model | model_id=%s | model_dir=%s",
-            _settings.model_id,
-            _settings.model_dir,
+            settings.model_id,
+            settings.model_dir,
         )
-        raise
+
+
+def _raise_if_load_failed() -> None:
+    if _load_error is not None:
+        raise HTTPException(status_code=500, detail=f"model failed to load: {_load_error}")
 
 
 def health() -> HealthResponse:
+    _raise_if_load_failed()
     return HealthResponse(ok=_llama is not None)
 
 
@@ -192,7 +245,8 @@ def chat_completions(payload: ChatCompletionRequest) -> ChatCompletionResponse:
     if payload.stream:
         raise HTTPException(status_code=400, detail="streaming is not supported")
     if _llama is None:
-        raise HTTPException(status_code=503, detail="model not loaded")
+        _raise_if_load_failed()
+        raise HTTPException(status_code=503, detail="model is loading")
     settings = _settings or load_settings()
     model_name = _model_name(settings)
     messages = _normalize_messages(payload.messages)
@@ -207,11 +261,12 @@ def chat_completions(payload: ChatCompletionRequest) -> ChatCompletionResponse:
         payload.tools is not None,
         payload.tool_choice is not None,
     )
-    log.debug(
-        "Chat completion input | model=%s | messages=%s",
-        payload.model or model_name,
-        json.dumps(messages, ensure_ascii=False, default=str),
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "Chat completion input | model=%s | messages=%s",
+            payload.model or model_name,
+            json.dumps(messages, ensure_ascii=False, default=str),
+        )
     try:
         kwargs: dict[str, object] = {"messages": messages, "temperature": temperature}
         if payload.max_tokens is not None:
@@ -221,7 +276,11 @@ def chat_completions(payload: ChatCompletionRequest) -> ChatCompletionResponse:
         if payload.stop is not None:
             kwargs["stop"] = payload.stop
         if payload.response_format is not None:
-            kwargs["response_format"] = payload.response_format
+            grammar = _response_format_grammar(payload.response_format)
+            if grammar is not None:
+                kwargs["grammar"] = grammar
+            else:
+                kwargs["response_format"] = payload.response_format
         if payload.tools is not None:
             kwargs["tools"] = payload.tools
         if payload.tool_choice is not None:
@@ -233,9 +292,6 @@ def chat_completions(payload: ChatCompletionRequest) -> ChatCompletionResponse:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     if isinstance(response, dict):
         response_data: dict[str, object] = response
-        print("======DEBUG=======")
-        print(response_data)
-        print("======DEBUG=======")
     else:
         try:
             if not isinstance(response, (str, bytes, bytearray)):
@@ -256,11 +312,12 @@ def chat_completions(payload: ChatCompletionRequest) -> ChatCompletionResponse:
     response_data.setdefault(
         "usage", {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
     )
-    log.debug(
-        "Chat completion output | model=%s | response=%s",
-        response_data.get("model"),
-        json.dumps(response_data, ensure_ascii=False, default=str),
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "Chat completion output | model=%s | response=%s",
+            response_data.get("model"),
+            json.dumps(response_data, ensure_ascii=False, default=str),
+        )
     log.debug(
         "Finished chat completion | model=%s | choices=%s",
         response_data.get("model"),
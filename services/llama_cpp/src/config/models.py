@@ -19,4 +19,8 @@ class LlamaCppSettings:
     n_threads: int
     temperature: float
     n_batch: int
+    n_ubatch: int
     seed: int
+    cache_size_mb: int
+    kv_cache_type: str
+    flash_attn: bool
@@ -9,6 +9,8 @@ from common.utils.yaml import load_yaml_config, resolve_config_path
 
 from .models import LlamaCppSettings
 
+KV_CACHE_TYPES = ("f16", "q8_0", "q4_0")
+
 
 def _load_chat_template(config_dir: Path, chat_format: str) -> str | None:
     parsed = urlparse(chat_format)
@@ -19,9 +21,10 @@ def _load_chat_template(config_dir: Path, chat_format: str) -> str | None:
 
     if chat_format.lower().endswith(".jinja") or Path(chat_format).suffix == ".jinja":
         template_path = resolve_config_path(config_dir, chat_format, chat_format)
-        if not template_path.exists():
-            raise RuntimeError(f"chat_format template not found: {template_path}")
-        return template_path.read_text()
+        try:
+            return template_path.read_text()
+        except FileNotFoundError:
+            raise RuntimeError(f"chat_format template not found: {template_path}") from None
 
     return None
 
@@ -43,11 +46,17 @@ def load_settings() -> LlamaCppSettings:
     quantization = str(config.get("quantization", "")).strip()
     if not quantization:
         raise RuntimeError("quantization is not set.")
+    kv_cache_type = str(config.get("kv_cache_type", "f16")).strip().lower()
+    if kv_cache_type not in KV_CACHE_TYPES:
+        raise RuntimeError(f"kv_cache_type must be one of: {', '.join(KV_CACHE_TYPES)}.")
+    flash_attn = bool(config.get("flash_attn", False))
+    if kv_cache_type != "f16" and not flash_attn:
+        raise RuntimeError("kv_cache_type q8_0 and q4_0 require flash_attn: true.")
 
     return LlamaCppSettings(
         host=str(config.get("host", "127.0.0.1")).strip(),
         port=int(config.get("port", 9100)),
-        reload=bool(config.get("reload", True)),
+        reload=bool(config.get("reload", False)),
         log_level=str(config.get("log_level", "info")).lower().strip(),
         chat_format=chat_format,
         model_id=model_id,
@@ -58,5 +67,9 @@ def load_settings() -> LlamaCppSettings:
         n_threads=int(config.get("n_threads", 0)),
         temperature=float(config.get("temperature", 0.2)),
         n_batch=int(config.get("n_batch", 512)),
+        n_ubatch=int(config.get("n_ubatch", 512)),
         seed=int(config.get("seed", 42)),
+        cache_size_mb=max(0, int(config.get("cache_size_mb", 0))),
+        kv_cache_type=kv_cache_type,
+        flash_attn=flash_attn,
     )
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
-from tempfile import gettempdir
-from uuid import uuid4
+from tempfile import NamedTemporaryFile
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 
@@ -15,6 +15,7 @@ from src.config.settings import load_settings
 from src.transcription import resolve_request_locale, transcription_text
 
 log = get_logger("mac_asr", "api")
+UPLOAD_COPY_BUFFER_BYTES = 1 << 20
 
 router = APIRouter()
 
@@ -39,11 +40,14 @@ async def transcribe_audio(
             detail="Speech recognition permission is required.",
         )
 
-    path = Path(gettempdir()) / f"{uuid4().hex}.wav"
+    buffer = NamedTemporaryFile(suffix=".wav", delete=False)
+    path = Path(buffer.name)
     try:
-        path.write_bytes(await file.read())
+        with buffer:
+            while chunk := await file.read(UPLOAD_COPY_BUFFER_BYTES):
+                buffer.write(chunk)
         log.debug("Stored ASR temp audio | path=%s | filename=%s", path, file.filename)
-        locale = resolve_request_locale(path, payload.language)
+        locale = await asyncio.to_thread(resolve_request_locale, path, payload.language)
         log.debug("Resolved ASR locale | requested=%s | resolved=%s", payload.language, locale)
         if not locale:
             log.debug("Skipping ASR request with empty locale | path=%s", path)
@@ -7,8 +7,10 @@ from app.api.v1.api import api_router
 from common.utils.ports import kill_processes_on_port
 from src.asr.permissions import ensure_speech_permission
 from src.config.settings import load_settings
+from src.lang_detect import startup
 
 app = FastAPI(title="Mac ASR", version="0.1.0")
+app.add_event_handler("startup", startup)
 app.include_router(api_router)
 
 
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
 import threading
+import time
 
 import Speech
 
 from common.utils.logs import get_logger
 
 log = get_logger("mac_asr", "asr")
+PERMISSION_CACHE_SECONDS = 60.0
+_authorized_at: float | None = None
 
 
 def ensure_speech_permission(prompt: bool = False) -> bool:
+    global _authorized_at
+    if _authorized_at is not None and time.monotonic() - _authorized_at < PERMISSION_CACHE_SECONDS:
+        return True
+
     status = int(Speech.SFSpeechRecognizer.authorizationStatus())
     authorized = int(getattr(Speech, "SFSpeechRecognizerAuthorizationStatusAuthorized", 3))
     not_determined = int(getattr(Speech, "SFSpeechRecognizerAuthorizationStatusNotDetermined", 0))
     log.debug("Checking speech permission | status=%s | prompt=%s", status, prompt)
 
     if status == authorized:
+        _authorized_at = time.monotonic()
         return True
     if status != not_determined or not prompt:
         return False
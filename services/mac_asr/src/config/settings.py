@@ -18,7 +18,7 @@ def load_settings() -> MacAsrSettings:
     return MacAsrSettings(
         host=str(config.get("host", "127.0.0.1")).strip(),
         port=int(config.get("port", 9092)),
-        reload=bool(config.get("reload", True)),
+        reload=bool(config.get("reload", False)),
         locale=str(config.get("locale", "auto")).strip(),
         default_locale=str(config.get("default_locale", "es")).strip(),
         transcription_timeout_s=max(3.0, float(config.get("transcription_timeout_s", 30.0))),
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-
-from faster_whisper import WhisperModel
+from typing import TYPE_CHECKING
 
 from common.utils.logs import get_logger
 
 from .config.settings import load_settings
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 log = get_logger("mac_asr", "lang_detect")
 _detector_model: WhisperModel | None = None
+_detector_lock = threading.Lock()
 
 
 def get_detector_model() -> WhisperModel:
@@ -17,15 +21,31 @@ def get_detector_model() -> WhisperModel:
     if _detector_model is not None:
         return _detector_model
 
-    settings = load_settings()
-    _detector_model = WhisperModel(
-        settings.detect_model,
-        device=settings.detect_device,
-        compute_type=settings.detect_compute_type,
-    )
+    from faster_whisper import WhisperModel
+
+    with _detector_lock:
+        if _detector_model is None:
+            settings = load_settings()
+            _detector_model = WhisperModel(
+                settings.detect_model,
+                device=settings.detect_device,
+                compute_type=settings.detect_compute_type,
+            )
     return _detector_model
 
 
+def startup() -> None:
+    settings = load_settings()
+    if settings.locale.strip().lower() != "auto":
+        return
+    try:
+        get_detector_model()
+    except Exception as exc:
+        log.warning("Language detector warm-up failed: %s", exc)
+        return
+    log.info("Loaded language detector model | model=%s", settings.detect_model)
+
+
 def detect_language(path: Path) -> tuple[str | None, float | None]:
     log.debug("Starting language detection | path=%s", path)
     try:
@@ -69,4 +89,4 @@ def detect_language(path: Path) -> tuple[str | None, float | None]:
     return language, probability
 
 
-__all__ = ["detect_language", "get_detector_model"]
+__all__ = ["detect_language", "get_detector_model", "startup"]
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from src.health.models import OcrHealthResponse
+from common.models.health import HealthResponse
 
 router = APIRouter()
 
 
-@router.get("/health", response_model=OcrHealthResponse)
-def health() -> OcrHealthResponse:
-    return OcrHealthResponse()
+@router.get("/health", response_model=HealthResponse)
+def health() -> HealthResponse:
+    return HealthResponse()
@@ -14,6 +14,6 @@ def load_settings() -> MacOcrSettings:
     return MacOcrSettings(
         host=str(config.get("host", "127.0.0.1")).strip(),
         port=int(config.get("port", 9093)),
-        reload=bool(config.get("reload", True)),
+        reload=bool(config.get("reload", False)),
         log_level=str(config.get("log_level", "info")).lower().strip(),
     )
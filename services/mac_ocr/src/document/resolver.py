@@ -12,6 +12,15 @@ from common.utils.logs import get_logger
 from common.models.ocr import OcrDocumentPayload
 
 log = get_logger("mac_ocr", "document")
+MIME_SUFFIXES = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+    "image/bmp": ".bmp",
+    "image/tiff": ".tiff",
+}
 
 
 def resolve_document_path(document: OcrDocumentPayload) -> Path:
@@ -37,15 +46,7 @@ def resolve_document_path(document: OcrDocumentPayload) -> Path:
 
     mime_type = header[5:].split(";", 1)[0]
     log.debug("Parsed OCR data URI | mime_type=%s", mime_type)
-    suffix = {
-        "image/png": ".png",
-        "image/jpeg": ".jpg",
-        "image/jpg": ".jpg",
-        "image/webp": ".webp",
-        "image/gif": ".gif",
-        "image/bmp": ".bmp",
-        "image/tiff": ".tiff",
-    }.get(mime_type, ".img")
+    suffix = MIME_SUFFIXES.get(mime_type, ".img")
 
     try:
         image_bytes = base64.b64decode(encoded, validate=True)